@@ -4,37 +4,43 @@ Copilot SDK - Python Client for GitHub Copilot CLI
 JSON-RPC based SDK for programmatic control of GitHub Copilot CLI
 """
 
-from .client import (
-    CopilotClient,
-    ExternalServerConfig,
-    ModelCapabilitiesOverride,
-    ModelLimitsOverride,
-    ModelSupportsOverride,
-    ModelVisionLimitsOverride,
-    SubprocessConfig,
-)
-from .session import (
-    CommandContext,
-    CommandDefinition,
-    CopilotSession,
-    CreateSessionFsHandler,
-    ElicitationContext,
-    ElicitationHandler,
-    ElicitationParams,
-    ElicitationResult,
-    InputOptions,
-    ProviderConfig,
-    SessionCapabilities,
-    SessionFsConfig,
-    SessionUiApi,
-    SessionUiCapabilities,
-)
-from .session_fs_provider import (
-    SessionFsFileInfo,
-    SessionFsProvider,
-    create_session_fs_adapter,
-)
-from .tools import convert_mcp_call_tool_result, define_tool
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import (
+        CopilotClient,
+        ExternalServerConfig,
+        ModelCapabilitiesOverride,
+        ModelLimitsOverride,
+        ModelSupportsOverride,
+        ModelVisionLimitsOverride,
+        SubprocessConfig,
+    )
+    from .session import (
+        CommandContext,
+        CommandDefinition,
+        CopilotSession,
+        CreateSessionFsHandler,
+        ElicitationContext,
+        ElicitationHandler,
+        ElicitationParams,
+        ElicitationResult,
+        InputOptions,
+        ProviderConfig,
+        SessionCapabilities,
+        SessionFsConfig,
+        SessionUiApi,
+        SessionUiCapabilities,
+    )
+    from .session_fs_provider import (
+        SessionFsFileInfo,
+        SessionFsProvider,
+        create_session_fs_adapter,
+    )
+    from .tools import convert_mcp_call_tool_result, define_tool
 
 __version__ = "0.1.0"
 
@@ -66,3 +72,70 @@ __all__ = [
     "convert_mcp_call_tool_result",
     "define_tool",
 ]
+
+
+# Public names are resolved on first access (PEP 562) so that importing a
+# lightweight submodule such as ``copilot.tools`` does not also load the client
+# and the large generated protocol modules it depends on.
+_LAZY_EXPORTS: dict[str, str] = {
+    "CopilotClient": ".client",
+    "ExternalServerConfig": ".client",
+    "ModelCapabilitiesOverride": ".client",
+    "ModelLimitsOverride": ".client",
+    "ModelSupportsOverride": ".client",
+    "ModelVisionLimitsOverride": ".client",
+    "SubprocessConfig": ".client",
+    "CommandContext": ".session",
+    "CommandDefinition": ".session",
+    "CopilotSession": ".session",
+    "CreateSessionFsHandler": ".session",
+    "ElicitationContext": ".session",
+    "ElicitationHandler": ".session",
+    "ElicitationParams": ".session",
+    "ElicitationResult": ".session",
+    "InputOptions": ".session",
+    "ProviderConfig": ".session",
+    "SessionCapabilities": ".session",
+    "SessionFsConfig": ".session",
+    "SessionUiApi": ".session",
+    "SessionUiCapabilities": ".session",
+    "SessionFsFileInfo": ".session_fs_provider",
+    "SessionFsProvider": ".session_fs_provider",
+    "create_session_fs_adapter": ".session_fs_provider",
+    "convert_mcp_call_tool_result": ".tools",
+    "define_tool": ".tools",
+}
+
+
+# Submodules that the package used to load as a side effect of importing it.
+# Reaching them through the package (``copilot.session.PermissionHandler``,
+# ``copilot.generated.rpc``) keeps working by loading the same set on first use.
+_EAGER_SUBMODULES = frozenset(
+    {
+        "_jsonrpc",
+        "_sdk_protocol_version",
+        "_telemetry",
+        "client",
+        "generated",
+        "session",
+        "session_fs_provider",
+        "tools",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        globals()[name] = value
+        return value
+    if name in _EAGER_SUBMODULES:
+        for export_module in sorted(set(_LAZY_EXPORTS.values())):
+            importlib.import_module(export_module, __name__)
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -8,11 +8,48 @@ Much simpler and more reliable than pure asyncio subprocess.
 import asyncio
 import inspect
 import json
+import re
 import threading
 import uuid
 from collections.abc import Awaitable, Callable
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(message: dict) -> bytes:
+    """Serialize a message to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # Values orjson can't encode (e.g. >64-bit ints) go through stdlib json
+    return json.dumps(message, separators=(",", ":")).encode("utf-8")
+
+
+# Digit runs that may hold an integer outside orjson's int64/uint64 range, which
+# orjson would silently turn into a float. Also matches inside strings or long
+# decimals; those payloads just take the (equivalent) stdlib path.
+_WIDE_INT_PATTERN = re.compile(rb"\d{20}|-\d{19}")
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a UTF-8 JSON payload, using orjson when it is installed.
+
+    Falls back to stdlib json, which keeps arbitrary-precision integers exact
+    and accepts lone surrogate escapes (emitted by Node's JSON.stringify for
+    strings cut mid surrogate pair) that orjson rejects.
+    """
+    if orjson is not None and not _WIDE_INT_PATTERN.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content.decode("utf-8"))
+
 
 class JsonRpcError(Exception):
     """JSON-RPC error response"""
@@ -180,12 +217,11 @@ class JsonRpcClient:
         loop = self._loop or asyncio.get_event_loop()
 
         def write():
-            content = json.dumps(message, separators=(",", ":"))
-            content_bytes = content.encode("utf-8")
-            header = f"Content-Length: {len(content_bytes)}\r\n\r\n"
+            content_bytes = _dumps(message)
+            header = f"Content-Length: {len(content_bytes)}\r\n\r\n".encode()
             with self._write_lock:
-                self.process.stdin.write(header.encode("utf-8"))
-                self.process.stdin.write(content_bytes)
+                # Single write so unbuffered pipes see one syscall per message
+                self.process.stdin.write(header + content_bytes)
                 self.process.stdin.flush()
 
         # Run in thread pool to avoid blocking
@@ -285,9 +321,8 @@ class JsonRpcClient:
 
         # Read exact content using loop to handle short reads
         content_bytes = self._read_exact(content_length)
-        content = content_bytes.decode("utf-8")
 
-        return json.loads(content)
+        return _loads(content_bytes)
 
     def _handle_message(self, message: dict):
         """Handle an incoming message (response or notification)"""
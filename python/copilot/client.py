@@ -582,7 +582,7 @@ class ModelInfo:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionContext:
     """Working directory context for a session"""
 
@@ -637,7 +637,7 @@ class SessionListFilter:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionMetadata:
     """Metadata about a session"""
 
@@ -747,6 +747,10 @@ NO_RESULT_PERMISSION_V2_ERROR = (
 # Servers reporting a version below this are rejected.
 MIN_PROTOCOL_VERSION = 2
 
+# How long CopilotClient.__aexit__ waits for a graceful stop() before
+# falling back to force_stop().
+CONTEXT_EXIT_STOP_TIMEOUT = 10.0  # seconds
+
 
 def _get_bundled_cli_path() -> str | None:
     """Get the path to the bundled CLI binary, if available."""
@@ -913,6 +917,7 @@ class CopilotClient:
         self._sessions_lock = threading.Lock()
         self._models_cache: list[ModelInfo] | None = None
         self._models_cache_lock = asyncio.Lock()
+        self._start_lock = asyncio.Lock()
         self._lifecycle_handlers: list[SessionLifecycleHandler] = []
         self._typed_lifecycle_handlers: dict[
             SessionLifecycleEventType, list[SessionLifecycleHandler]
@@ -1013,9 +1018,18 @@ class CopilotClient:
         Exit the async context manager.
 
         Performs graceful cleanup by destroying all active sessions and stopping
-        the CLI server.
+        the CLI server. If that does not finish within
+        ``CONTEXT_EXIT_STOP_TIMEOUT`` seconds, or the enclosing task is cancelled
+        while it runs, the client is force-stopped instead so the CLI process is
+        never left running.
         """
-        await self.stop()
+        try:
+            await asyncio.wait_for(self.stop(), timeout=CONTEXT_EXIT_STOP_TIMEOUT)
+        except TimeoutError:
+            await self.force_stop()
+        except asyncio.CancelledError:
+            await self.force_stop()
+            raise
 
     async def start(self) -> None:
         """
@@ -1036,9 +1050,16 @@ class CopilotClient:
             >>> await client.start()
             >>> # Now ready to create sessions
         """
-        if self._state == "connected":
-            return
-
+        # Serialize startup so concurrent first-use callers (e.g. several
+        # create_session calls gathered before start) share one CLI connection
+        # instead of each spawning their own server process.
+        async with self._start_lock:
+            if self._state == "connected":
+                return
+            await self._start()
+
+    async def _start(self) -> None:
+        """Spawn the CLI server (if needed) and connect. Caller holds ``_start_lock``."""
         self._state = "connecting"
 
         try:
@@ -1096,6 +1117,13 @@ class CopilotClient:
             ...     for error in eg.exceptions:
             ...         print(f"Cleanup error: {error.message}")
         """
+        # Wait for any in-progress start() so its process and connection are
+        # torn down here rather than left running after stop() returns.
+        async with self._start_lock:
+            await self._stop()
+
+    async def _stop(self) -> None:
+        """Disconnect sessions and shut down the CLI. Caller holds ``_start_lock``."""
         errors: list[StopError] = []
 
         # Atomically take ownership of all sessions and clear the dict
@@ -1104,7 +1132,7 @@ class CopilotClient:
             sessions_to_destroy = list(self._sessions.values())
             self._sessions.clear()
 
-        for session in sessions_to_destroy:
+        async def disconnect_session(session: CopilotSession) -> None:
             try:
                 await session.disconnect()
             except Exception as e:
@@ -1112,6 +1140,10 @@ class CopilotClient:
                     StopError(message=f"Failed to disconnect session {session.session_id}: {e}")
                 )
 
+        # Sessions are independent, so disconnect them concurrently instead of
+        # paying one round-trip per session.
+        await asyncio.gather(*(disconnect_session(session) for session in sessions_to_destroy))
+
         # Close client
         if self._client:
             await self._client.stop()
@@ -1147,6 +1179,9 @@ class CopilotClient:
         - Force closes the connection (closes the underlying transport)
         - Kills the CLI process (if spawned by this client)
 
+        Unlike :meth:`stop`, this does not wait for an in-progress :meth:`start`,
+        so a start that is still connecting may finish after this returns.
+
         Example:
             >>> # If normal stop hangs, force stop
             >>> try:
@@ -55,6 +55,12 @@ def from_none(x: Any) -> Any:
 
 def from_union(fs: list[Callable[[Any], T]], x: Any) -> T:
     for f in fs:
+        # Optional fields are the common case: test for None directly instead of
+        # raising and catching an AssertionError from from_none on every value.
+        if f is from_none:
+            if x is None:
+                return x
+            continue
         try:
             return f(x)
         except Exception:
@@ -188,7 +194,7 @@ class SessionEventType(Enum):
         return cls.UNKNOWN
 
 
-@dataclass
+@dataclass(slots=True)
 class RawSessionEventData:
     raw: Any
 
@@ -254,7 +260,7 @@ class Data:
         return {_compat_to_json_key(key): _compat_to_json_value(value) for key, value in self._values.items() if value is not None}
 
 
-@dataclass
+@dataclass(slots=True)
 class AbortData:
     "Turn abort information including the reason for termination"
     reason: str
@@ -273,7 +279,7 @@ class AbortData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantIntentData:
     "Agent intent description for current activity or plan"
     intent: str
@@ -292,7 +298,7 @@ class AssistantIntentData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantMessageData:
     "Assistant response containing text content, optional tool requests, and interaction metadata"
     content: str
@@ -361,7 +367,7 @@ class AssistantMessageData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantMessageDeltaData:
     "Streaming assistant message delta for incremental response updates"
     delta_content: str
@@ -390,7 +396,7 @@ class AssistantMessageDeltaData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantMessageToolRequest:
     "A tool invocation request from the assistant"
     name: str
@@ -438,7 +444,7 @@ class AssistantMessageToolRequest:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantReasoningData:
     "Assistant reasoning content for timeline display with complete thinking text"
     content: str
@@ -461,7 +467,7 @@ class AssistantReasoningData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantReasoningDeltaData:
     "Streaming reasoning delta for incremental extended thinking updates"
     delta_content: str
@@ -484,7 +490,7 @@ class AssistantReasoningDeltaData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantStreamingDeltaData:
     "Streaming response progress with cumulative byte count"
     total_response_size_bytes: float
@@ -503,7 +509,7 @@ class AssistantStreamingDeltaData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantTurnEndData:
     "Turn completion metadata including the turn identifier"
     turn_id: str
@@ -522,7 +528,7 @@ class AssistantTurnEndData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantTurnStartData:
     "Turn initialization metadata including identifier and interaction tracking"
     turn_id: str
@@ -546,7 +552,7 @@ class AssistantTurnStartData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantUsageCopilotUsage:
     "Per-request cost and usage data from the CAPI copilot_usage response field"
     token_details: list[AssistantUsageCopilotUsageTokenDetail]
@@ -569,7 +575,7 @@ class AssistantUsageCopilotUsage:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantUsageCopilotUsageTokenDetail:
     "Token usage detail for a single billing category"
     batch_size: float
@@ -600,7 +606,7 @@ class AssistantUsageCopilotUsageTokenDetail:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantUsageData:
     "LLM API call usage metrics including tokens, costs, quotas, and billing information"
     model: str
@@ -700,7 +706,7 @@ class AssistantUsageData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantUsageQuotaSnapshot:
     entitlement_requests: float
     is_unlimited_entitlement: bool
@@ -747,7 +753,7 @@ class AssistantUsageQuotaSnapshot:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoModeSwitchCompletedData:
     "Auto mode switch completion notification"
     request_id: str
@@ -770,7 +776,7 @@ class AutoModeSwitchCompletedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoModeSwitchRequestedData:
     "Auto mode switch request notification requiring user approval"
     request_id: str
@@ -799,7 +805,7 @@ class AutoModeSwitchRequestedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class CapabilitiesChangedData:
     "Session capability change notification"
     ui: CapabilitiesChangedUI | None = None
@@ -819,7 +825,7 @@ class CapabilitiesChangedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class CapabilitiesChangedUI:
     "UI capability changes"
     elicitation: bool | None = None
@@ -839,7 +845,7 @@ class CapabilitiesChangedUI:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandCompletedData:
     "Queued command completion notification signaling UI dismissal"
     request_id: str
@@ -858,7 +864,7 @@ class CommandCompletedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandExecuteData:
     "Registered command dispatch request routed to the owning client"
     args: str
@@ -889,7 +895,7 @@ class CommandExecuteData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandQueuedData:
     "Queued slash command dispatch request for client execution"
     command: str
@@ -912,7 +918,7 @@ class CommandQueuedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandsChangedCommand:
     name: str
     description: str | None = None
@@ -935,7 +941,7 @@ class CommandsChangedCommand:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandsChangedData:
     "SDK command registration change notification"
     commands: list[CommandsChangedCommand]
@@ -954,7 +960,7 @@ class CommandsChangedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class CompactionCompleteCompactionTokensUsed:
     "Token usage breakdown for the compaction LLM call (aligned with assistant.usage format)"
     cache_read_tokens: float | None = None
@@ -1004,7 +1010,7 @@ class CompactionCompleteCompactionTokensUsed:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class CompactionCompleteCompactionTokensUsedCopilotUsage:
     "Per-request cost and usage data from the CAPI copilot_usage response field"
     token_details: list[CompactionCompleteCompactionTokensUsedCopilotUsageTokenDetail]
@@ -1027,7 +1033,7 @@ class CompactionCompleteCompactionTokensUsedCopilotUsage:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class CompactionCompleteCompactionTokensUsedCopilotUsageTokenDetail:
     "Token usage detail for a single billing category"
     batch_size: float
@@ -1058,7 +1064,7 @@ class CompactionCompleteCompactionTokensUsedCopilotUsageTokenDetail:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomAgentsUpdatedAgent:
     description: str
     display_name: str
@@ -1105,7 +1111,7 @@ class CustomAgentsUpdatedAgent:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ElicitationCompletedData:
     "Elicitation request completion with the user's response"
     request_id: str
@@ -1134,7 +1140,7 @@ class ElicitationCompletedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ElicitationRequestedData:
     "Elicitation request; may be form-based (structured input) or URL-based (browser redirect)"
     message: str
@@ -1182,7 +1188,7 @@ class ElicitationRequestedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ElicitationRequestedSchema:
     "JSON Schema describing the form fields to present to the user (form mode only)"
     properties: dict[str, Any]
@@ -1210,7 +1216,7 @@ class ElicitationRequestedSchema:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ExitPlanModeCompletedData:
     "Plan mode exit completion with the user's approval decision and optional feedback"
     request_id: str
@@ -1249,7 +1255,7 @@ class ExitPlanModeCompletedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ExitPlanModeRequestedData:
     "Plan approval request with plan content and available user actions"
     actions: list[str]
@@ -1284,7 +1290,7 @@ class ExitPlanModeRequestedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtensionsLoadedExtension:
     id: str
     name: str
@@ -1314,7 +1320,7 @@ class ExtensionsLoadedExtension:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalToolCompletedData:
     "External tool completion notification signaling UI dismissal"
     request_id: str
@@ -1333,7 +1339,7 @@ class ExternalToolCompletedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalToolRequestedData:
     "External tool invocation request for client-side tool execution"
     request_id: str
@@ -1379,7 +1385,7 @@ class ExternalToolRequestedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class HandoffRepository:
     "Repository context for the handed-off session"
     name: str
@@ -1407,7 +1413,7 @@ class HandoffRepository:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class HookEndData:
     "Hook invocation completion details including output, success status, and error information"
     hook_invocation_id: str
@@ -1444,7 +1450,7 @@ class HookEndData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class HookEndError:
     "Error details when the hook failed"
     message: str
@@ -1468,7 +1474,7 @@ class HookEndError:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class HookStartData:
     "Hook invocation start details including type and input data"
     hook_invocation_id: str
@@ -1496,7 +1502,7 @@ class HookStartData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class McpOauthCompletedData:
     "MCP OAuth request completion notification"
     request_id: str
@@ -1515,7 +1521,7 @@ class McpOauthCompletedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class McpOauthRequiredData:
     "OAuth authentication request for an MCP server"
     request_id: str
@@ -1547,7 +1553,7 @@ class McpOauthRequiredData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class McpOauthRequiredStaticClientConfig:
     "Static OAuth client configuration, if the server specifies one"
     client_id: str
@@ -1571,7 +1577,7 @@ class McpOauthRequiredStaticClientConfig:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class McpServersLoadedServer:
     name: str
     status: McpServersLoadedServerStatus
@@ -1603,7 +1609,7 @@ class McpServersLoadedServer:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelCallFailureData:
     "Failed LLM API call metadata for telemetry"
     source: ModelCallFailureSource
@@ -1657,7 +1663,7 @@ class ModelCallFailureData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingMessagesModifiedData:
     "Empty payload; the event signals that the pending message queue has changed"
     @staticmethod
@@ -1669,7 +1675,7 @@ class PendingMessagesModifiedData:
         return {}
 
 
-@dataclass
+@dataclass(slots=True)
 class PermissionCompletedData:
     "Permission request completion notification signaling UI dismissal"
     request_id: str
@@ -1697,7 +1703,7 @@ class PermissionCompletedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PermissionCompletedResult:
     "The result of the permission request"
     kind: PermissionCompletedKind
@@ -1716,7 +1722,7 @@ class PermissionCompletedResult:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PermissionPromptRequest:
     "Derived user-facing permission prompt details for UI consumers"
     kind: PermissionPromptRequestKind
@@ -1865,7 +1871,7 @@ class PermissionPromptRequest:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PermissionRequest:
     "Details of the permission being requested"
     kind: PermissionRequestKind
@@ -2024,7 +2030,7 @@ class PermissionRequest:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PermissionRequestShellCommand:
     identifier: str
     read_only: bool
@@ -2046,7 +2052,7 @@ class PermissionRequestShellCommand:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PermissionRequestShellPossibleUrl:
     url: str
 
@@ -2064,7 +2070,7 @@ class PermissionRequestShellPossibleUrl:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PermissionRequestedData:
     "Permission request notification requiring client approval with request details"
     permission_request: PermissionRequest
@@ -2097,7 +2103,7 @@ class PermissionRequestedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SamplingCompletedData:
     "Sampling request completion notification signaling UI dismissal"
     request_id: str
@@ -2116,7 +2122,7 @@ class SamplingCompletedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SamplingRequestedData:
     "Sampling request from an MCP server; contains the server name and a requestId for correlation"
     mcp_request_id: Any
@@ -2143,7 +2149,7 @@ class SamplingRequestedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionBackgroundTasksChangedData:
     @staticmethod
     def from_dict(obj: Any) -> "SessionBackgroundTasksChangedData":
@@ -2154,7 +2160,7 @@ class SessionBackgroundTasksChangedData:
         return {}
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionCompactionCompleteData:
     "Conversation compaction results including success status, metrics, and optional error details"
     success: bool
@@ -2243,7 +2249,7 @@ class SessionCompactionCompleteData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionCompactionStartData:
     "Context window breakdown at the start of LLM-powered conversation compaction"
     conversation_tokens: float | None = None
@@ -2273,7 +2279,7 @@ class SessionCompactionStartData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionContextChangedData:
     "Working directory and git context at session start"
     cwd: str
@@ -2327,7 +2333,7 @@ class SessionContextChangedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionCustomAgentsUpdatedData:
     agents: list[CustomAgentsUpdatedAgent]
     errors: list[str]
@@ -2353,7 +2359,7 @@ class SessionCustomAgentsUpdatedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionErrorData:
     "Error details for timeline display including message and optional diagnostic information"
     error_type: str
@@ -2406,7 +2412,7 @@ class SessionErrorData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionExtensionsLoadedData:
     extensions: list[ExtensionsLoadedExtension]
 
@@ -2424,7 +2430,7 @@ class SessionExtensionsLoadedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionHandoffData:
     "Session handoff metadata including source, context, and repository information"
     handoff_time: datetime
@@ -2472,7 +2478,7 @@ class SessionHandoffData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionIdleData:
     "Payload indicating the session is idle with no background agents in flight"
     aborted: bool | None = None
@@ -2492,7 +2498,7 @@ class SessionIdleData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfoData:
     "Informational message for timeline display with categorization"
     info_type: str
@@ -2525,7 +2531,7 @@ class SessionInfoData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionMcpServerStatusChangedData:
     server_name: str
     status: McpServerStatusChangedStatus
@@ -2547,7 +2553,7 @@ class SessionMcpServerStatusChangedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionMcpServersLoadedData:
     servers: list[McpServersLoadedServer]
 
@@ -2565,7 +2571,7 @@ class SessionMcpServersLoadedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionModeChangedData:
     "Agent mode change details including previous and new modes"
     new_mode: str
@@ -2588,7 +2594,7 @@ class SessionModeChangedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionModelChangeData:
     "Model change details including previous and new model identifiers"
     new_model: str
@@ -2627,7 +2633,7 @@ class SessionModelChangeData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionPlanChangedData:
     "Plan file operation details indicating what changed"
     operation: PlanChangedOperation
@@ -2646,7 +2652,7 @@ class SessionPlanChangedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionRemoteSteerableChangedData:
     "Notifies Mission Control that the session's remote steering capability has changed"
     remote_steerable: bool
@@ -2665,7 +2671,7 @@ class SessionRemoteSteerableChangedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionResumeData:
     "Session resume metadata including current context and event count"
     event_count: float
@@ -2713,7 +2719,7 @@ class SessionResumeData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionShutdownData:
     "Session termination metrics including usage statistics, code changes, and shutdown reason"
     code_changes: ShutdownCodeChanges
@@ -2782,7 +2788,7 @@ class SessionShutdownData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionSkillsLoadedData:
     skills: list[SkillsLoadedSkill]
 
@@ -2800,7 +2806,7 @@ class SessionSkillsLoadedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionSnapshotRewindData:
     "Session rewind details including target event and count of removed events"
     events_removed: float
@@ -2823,7 +2829,7 @@ class SessionSnapshotRewindData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStartData:
     "Session initialization metadata including context and configuration"
     copilot_version: str
@@ -2883,7 +2889,7 @@ class SessionStartData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionTaskCompleteData:
     "Task completion notification with summary from the agent"
     success: bool | None = None
@@ -2908,7 +2914,7 @@ class SessionTaskCompleteData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionTitleChangedData:
     "Session title change payload containing the new display title"
     title: str
@@ -2927,7 +2933,7 @@ class SessionTitleChangedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionToolsUpdatedData:
     model: str
 
@@ -2945,7 +2951,7 @@ class SessionToolsUpdatedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionTruncationData:
     "Conversation truncation statistics including token counts and removed content metrics"
     messages_removed_during_truncation: float
@@ -2992,7 +2998,7 @@ class SessionTruncationData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionUsageInfoData:
     "Current context window usage statistics including token and message counts"
     current_tokens: float
@@ -3039,7 +3045,7 @@ class SessionUsageInfoData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionWarningData:
     "Warning message for timeline display with categorization"
     message: str
@@ -3067,7 +3073,7 @@ class SessionWarningData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionWorkspaceFileChangedData:
     "Workspace file change details including path and operation type"
     operation: WorkspaceFileChangedOperation
@@ -3090,7 +3096,7 @@ class SessionWorkspaceFileChangedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ShutdownCodeChanges:
     "Aggregate code change metrics for the session"
     files_modified: list[str]
@@ -3117,7 +3123,7 @@ class ShutdownCodeChanges:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ShutdownModelMetric:
     requests: ShutdownModelMetricRequests
     usage: ShutdownModelMetricUsage
@@ -3139,7 +3145,7 @@ class ShutdownModelMetric:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ShutdownModelMetricRequests:
     "Request count and cost metrics"
     cost: float
@@ -3162,7 +3168,7 @@ class ShutdownModelMetricRequests:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ShutdownModelMetricUsage:
     "Token usage breakdown"
     cache_read_tokens: float
@@ -3198,7 +3204,7 @@ class ShutdownModelMetricUsage:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillInvokedData:
     "Skill invocation details including content, allowed tools, and plugin metadata"
     content: str
@@ -3245,7 +3251,7 @@ class SkillInvokedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillsLoadedSkill:
     description: str
     enabled: bool
@@ -3284,7 +3290,7 @@ class SkillsLoadedSkill:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SubagentCompletedData:
     "Sub-agent completion details for successful execution"
     agent_display_name: str
@@ -3331,7 +3337,7 @@ class SubagentCompletedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SubagentDeselectedData:
     "Empty payload; the event signals that the custom agent was deselected, returning to the default agent"
     @staticmethod
@@ -3343,7 +3349,7 @@ class SubagentDeselectedData:
         return {}
 
 
-@dataclass
+@dataclass(slots=True)
 class SubagentFailedData:
     "Sub-agent failure details including error message and agent information"
     agent_display_name: str
@@ -3394,7 +3400,7 @@ class SubagentFailedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SubagentSelectedData:
     "Custom agent selection details including name and available tools"
     agent_display_name: str
@@ -3421,7 +3427,7 @@ class SubagentSelectedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SubagentStartedData:
     "Sub-agent startup details including parent tool call and agent information"
     agent_description: str
@@ -3452,7 +3458,7 @@ class SubagentStartedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMessageData:
     "System/developer instruction content with role and optional template metadata"
     content: str
@@ -3485,7 +3491,7 @@ class SystemMessageData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMessageMetadata:
     "Metadata about the prompt template and its construction"
     prompt_version: str | None = None
@@ -3510,7 +3516,7 @@ class SystemMessageMetadata:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemNotification:
     "Structured metadata identifying what triggered this notification"
     type: SystemNotificationType
@@ -3599,7 +3605,7 @@ class SystemNotification:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemNotificationData:
     "System-generated notification for runtime events like background task completion"
     content: str
@@ -3622,7 +3628,7 @@ class SystemNotificationData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutionCompleteContent:
     "A content block within a tool result, which may be text, terminal output, image, audio, or a resource"
     type: ToolExecutionCompleteContentType
@@ -3701,7 +3707,7 @@ class ToolExecutionCompleteContent:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutionCompleteContentResourceLinkIcon:
     "Icon image for a resource"
     src: str
@@ -3735,7 +3741,7 @@ class ToolExecutionCompleteContentResourceLinkIcon:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutionCompleteData:
     "Tool execution completion results including success status, detailed output, and error information"
     success: bool
@@ -3794,7 +3800,7 @@ class ToolExecutionCompleteData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutionCompleteError:
     "Error details when the tool execution failed"
     message: str
@@ -3818,7 +3824,7 @@ class ToolExecutionCompleteError:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutionCompleteResult:
     "Tool execution result on success"
     content: str
@@ -3847,7 +3853,7 @@ class ToolExecutionCompleteResult:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutionPartialResultData:
     "Streaming tool execution output for incremental result display"
     partial_output: str
@@ -3870,7 +3876,7 @@ class ToolExecutionPartialResultData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutionProgressData:
     "Tool execution progress notification with status message"
     progress_message: str
@@ -3893,7 +3899,7 @@ class ToolExecutionProgressData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutionStartData:
     "Tool execution startup details including MCP server information when applicable"
     tool_call_id: str
@@ -3937,7 +3943,7 @@ class ToolExecutionStartData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolUserRequestedData:
     "User-initiated tool invocation request with tool name and arguments"
     tool_call_id: str
@@ -3965,7 +3971,7 @@ class ToolUserRequestedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class UserInputCompletedData:
     "User input request completion with the user's response"
     request_id: str
@@ -3994,7 +4000,7 @@ class UserInputCompletedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class UserInputRequestedData:
     "User input request notification with question and optional predefined choices"
     question: str
@@ -4032,7 +4038,7 @@ class UserInputRequestedData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class UserMessageAttachment:
     "A user message attachment — a file, directory, code selection, blob, or GitHub reference"
     type: UserMessageAttachmentType
@@ -4116,7 +4122,7 @@ class UserMessageAttachment:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class UserMessageAttachmentFileLineRange:
     "Optional line range to scope the attachment to a specific section of the file"
     end: float
@@ -4139,7 +4145,7 @@ class UserMessageAttachmentFileLineRange:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class UserMessageAttachmentSelectionDetails:
     "Position range of the selection within the file"
     end: UserMessageAttachmentSelectionDetailsEnd
@@ -4162,7 +4168,7 @@ class UserMessageAttachmentSelectionDetails:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class UserMessageAttachmentSelectionDetailsEnd:
     "End position of the selection"
     character: float
@@ -4185,7 +4191,7 @@ class UserMessageAttachmentSelectionDetailsEnd:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class UserMessageAttachmentSelectionDetailsStart:
     "Start position of the selection"
     character: float
@@ -4208,7 +4214,7 @@ class UserMessageAttachmentSelectionDetailsStart:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class UserMessageData:
     content: str
     agent_mode: UserMessageAgentMode | None = None
@@ -4261,7 +4267,7 @@ class UserMessageData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkingDirectoryContext:
     "Working directory and git context at session start"
     cwd: str
@@ -4539,7 +4545,88 @@ class WorkspaceFileChangedOperation(Enum):
 SessionEventData = SessionStartData | SessionResumeData | SessionRemoteSteerableChangedData | SessionErrorData | SessionIdleData | SessionTitleChangedData | SessionInfoData | SessionWarningData | SessionModelChangeData | SessionModeChangedData | SessionPlanChangedData | SessionWorkspaceFileChangedData | SessionHandoffData | SessionTruncationData | SessionSnapshotRewindData | SessionShutdownData | SessionContextChangedData | SessionUsageInfoData | SessionCompactionStartData | SessionCompactionCompleteData | SessionTaskCompleteData | UserMessageData | PendingMessagesModifiedData | AssistantTurnStartData | AssistantIntentData | AssistantReasoningData | AssistantReasoningDeltaData | AssistantStreamingDeltaData | AssistantMessageData | AssistantMessageDeltaData | AssistantTurnEndData | AssistantUsageData | ModelCallFailureData | AbortData | ToolUserRequestedData | ToolExecutionStartData | ToolExecutionPartialResultData | ToolExecutionProgressData | ToolExecutionCompleteData | SkillInvokedData | SubagentStartedData | SubagentCompletedData | SubagentFailedData | SubagentSelectedData | SubagentDeselectedData | HookStartData | HookEndData | SystemMessageData | SystemNotificationData | PermissionRequestedData | PermissionCompletedData | UserInputRequestedData | UserInputCompletedData | ElicitationRequestedData | ElicitationCompletedData | SamplingRequestedData | SamplingCompletedData | McpOauthRequiredData | McpOauthCompletedData | ExternalToolRequestedData | ExternalToolCompletedData | CommandQueuedData | CommandExecuteData | CommandCompletedData | AutoModeSwitchRequestedData | AutoModeSwitchCompletedData | CommandsChangedData | CapabilitiesChangedData | ExitPlanModeRequestedData | ExitPlanModeCompletedData | SessionToolsUpdatedData | SessionBackgroundTasksChangedData | SessionSkillsLoadedData | SessionCustomAgentsUpdatedData | SessionMcpServersLoadedData | SessionMcpServerStatusChangedData | SessionExtensionsLoadedData | RawSessionEventData | Data
 
 
-@dataclass
+_SESSION_EVENT_DATA_PARSERS: dict[SessionEventType, Callable[[Any], SessionEventData]] = {
+    SessionEventType.SESSION_START: SessionStartData.from_dict,
+    SessionEventType.SESSION_RESUME: SessionResumeData.from_dict,
+    SessionEventType.SESSION_REMOTE_STEERABLE_CHANGED: SessionRemoteSteerableChangedData.from_dict,
+    SessionEventType.SESSION_ERROR: SessionErrorData.from_dict,
+    SessionEventType.SESSION_IDLE: SessionIdleData.from_dict,
+    SessionEventType.SESSION_TITLE_CHANGED: SessionTitleChangedData.from_dict,
+    SessionEventType.SESSION_INFO: SessionInfoData.from_dict,
+    SessionEventType.SESSION_WARNING: SessionWarningData.from_dict,
+    SessionEventType.SESSION_MODEL_CHANGE: SessionModelChangeData.from_dict,
+    SessionEventType.SESSION_MODE_CHANGED: SessionModeChangedData.from_dict,
+    SessionEventType.SESSION_PLAN_CHANGED: SessionPlanChangedData.from_dict,
+    SessionEventType.SESSION_WORKSPACE_FILE_CHANGED: SessionWorkspaceFileChangedData.from_dict,
+    SessionEventType.SESSION_HANDOFF: SessionHandoffData.from_dict,
+    SessionEventType.SESSION_TRUNCATION: SessionTruncationData.from_dict,
+    SessionEventType.SESSION_SNAPSHOT_REWIND: SessionSnapshotRewindData.from_dict,
+    SessionEventType.SESSION_SHUTDOWN: SessionShutdownData.from_dict,
+    SessionEventType.SESSION_CONTEXT_CHANGED: SessionContextChangedData.from_dict,
+    SessionEventType.SESSION_USAGE_INFO: SessionUsageInfoData.from_dict,
+    SessionEventType.SESSION_COMPACTION_START: SessionCompactionStartData.from_dict,
+    SessionEventType.SESSION_COMPACTION_COMPLETE: SessionCompactionCompleteData.from_dict,
+    SessionEventType.SESSION_TASK_COMPLETE: SessionTaskCompleteData.from_dict,
+    SessionEventType.USER_MESSAGE: UserMessageData.from_dict,
+    SessionEventType.PENDING_MESSAGES_MODIFIED: PendingMessagesModifiedData.from_dict,
+    SessionEventType.ASSISTANT_TURN_START: AssistantTurnStartData.from_dict,
+    SessionEventType.ASSISTANT_INTENT: AssistantIntentData.from_dict,
+    SessionEventType.ASSISTANT_REASONING: AssistantReasoningData.from_dict,
+    SessionEventType.ASSISTANT_REASONING_DELTA: AssistantReasoningDeltaData.from_dict,
+    SessionEventType.ASSISTANT_STREAMING_DELTA: AssistantStreamingDeltaData.from_dict,
+    SessionEventType.ASSISTANT_MESSAGE: AssistantMessageData.from_dict,
+    SessionEventType.ASSISTANT_MESSAGE_DELTA: AssistantMessageDeltaData.from_dict,
+    SessionEventType.ASSISTANT_TURN_END: AssistantTurnEndData.from_dict,
+    SessionEventType.ASSISTANT_USAGE: AssistantUsageData.from_dict,
+    SessionEventType.MODEL_CALL_FAILURE: ModelCallFailureData.from_dict,
+    SessionEventType.ABORT: AbortData.from_dict,
+    SessionEventType.TOOL_USER_REQUESTED: ToolUserRequestedData.from_dict,
+    SessionEventType.TOOL_EXECUTION_START: ToolExecutionStartData.from_dict,
+    SessionEventType.TOOL_EXECUTION_PARTIAL_RESULT: ToolExecutionPartialResultData.from_dict,
+    SessionEventType.TOOL_EXECUTION_PROGRESS: ToolExecutionProgressData.from_dict,
+    SessionEventType.TOOL_EXECUTION_COMPLETE: ToolExecutionCompleteData.from_dict,
+    SessionEventType.SKILL_INVOKED: SkillInvokedData.from_dict,
+    SessionEventType.SUBAGENT_STARTED: SubagentStartedData.from_dict,
+    SessionEventType.SUBAGENT_COMPLETED: SubagentCompletedData.from_dict,
+    SessionEventType.SUBAGENT_FAILED: SubagentFailedData.from_dict,
+    SessionEventType.SUBAGENT_SELECTED: SubagentSelectedData.from_dict,
+    SessionEventType.SUBAGENT_DESELECTED: SubagentDeselectedData.from_dict,
+    SessionEventType.HOOK_START: HookStartData.from_dict,
+    SessionEventType.HOOK_END: HookEndData.from_dict,
+    SessionEventType.SYSTEM_MESSAGE: SystemMessageData.from_dict,
+    SessionEventType.SYSTEM_NOTIFICATION: SystemNotificationData.from_dict,
+    SessionEventType.PERMISSION_REQUESTED: PermissionRequestedData.from_dict,
+    SessionEventType.PERMISSION_COMPLETED: PermissionCompletedData.from_dict,
+    SessionEventType.USER_INPUT_REQUESTED: UserInputRequestedData.from_dict,
+    SessionEventType.USER_INPUT_COMPLETED: UserInputCompletedData.from_dict,
+    SessionEventType.ELICITATION_REQUESTED: ElicitationRequestedData.from_dict,
+    SessionEventType.ELICITATION_COMPLETED: ElicitationCompletedData.from_dict,
+    SessionEventType.SAMPLING_REQUESTED: SamplingRequestedData.from_dict,
+    SessionEventType.SAMPLING_COMPLETED: SamplingCompletedData.from_dict,
+    SessionEventType.MCP_OAUTH_REQUIRED: McpOauthRequiredData.from_dict,
+    SessionEventType.MCP_OAUTH_COMPLETED: McpOauthCompletedData.from_dict,
+    SessionEventType.EXTERNAL_TOOL_REQUESTED: ExternalToolRequestedData.from_dict,
+    SessionEventType.EXTERNAL_TOOL_COMPLETED: ExternalToolCompletedData.from_dict,
+    SessionEventType.COMMAND_QUEUED: CommandQueuedData.from_dict,
+    SessionEventType.COMMAND_EXECUTE: CommandExecuteData.from_dict,
+    SessionEventType.COMMAND_COMPLETED: CommandCompletedData.from_dict,
+    SessionEventType.AUTO_MODE_SWITCH_REQUESTED: AutoModeSwitchRequestedData.from_dict,
+    SessionEventType.AUTO_MODE_SWITCH_COMPLETED: AutoModeSwitchCompletedData.from_dict,
+    SessionEventType.COMMANDS_CHANGED: CommandsChangedData.from_dict,
+    SessionEventType.CAPABILITIES_CHANGED: CapabilitiesChangedData.from_dict,
+    SessionEventType.EXIT_PLAN_MODE_REQUESTED: ExitPlanModeRequestedData.from_dict,
+    SessionEventType.EXIT_PLAN_MODE_COMPLETED: ExitPlanModeCompletedData.from_dict,
+    SessionEventType.SESSION_TOOLS_UPDATED: SessionToolsUpdatedData.from_dict,
+    SessionEventType.SESSION_BACKGROUND_TASKS_CHANGED: SessionBackgroundTasksChangedData.from_dict,
+    SessionEventType.SESSION_SKILLS_LOADED: SessionSkillsLoadedData.from_dict,
+    SessionEventType.SESSION_CUSTOM_AGENTS_UPDATED: SessionCustomAgentsUpdatedData.from_dict,
+    SessionEventType.SESSION_MCP_SERVERS_LOADED: SessionMcpServersLoadedData.from_dict,
+    SessionEventType.SESSION_MCP_SERVER_STATUS_CHANGED: SessionMcpServerStatusChangedData.from_dict,
+    SessionEventType.SESSION_EXTENSIONS_LOADED: SessionExtensionsLoadedData.from_dict,
+}
+
+
+@dataclass(slots=True)
 class SessionEvent:
     data: SessionEventData
     id: UUID
@@ -4559,85 +4646,7 @@ class SessionEvent:
         ephemeral = from_union([from_bool, from_none], obj.get("ephemeral"))
         parent_id = from_union([from_none, from_uuid], obj.get("parentId"))
         data_obj = obj.get("data")
-        match event_type:
-            case SessionEventType.SESSION_START: data = SessionStartData.from_dict(data_obj)
-            case SessionEventType.SESSION_RESUME: data = SessionResumeData.from_dict(data_obj)
-            case SessionEventType.SESSION_REMOTE_STEERABLE_CHANGED: data = SessionRemoteSteerableChangedData.from_dict(data_obj)
-            case SessionEventType.SESSION_ERROR: data = SessionErrorData.from_dict(data_obj)
-            case SessionEventType.SESSION_IDLE: data = SessionIdleData.from_dict(data_obj)
-            case SessionEventType.SESSION_TITLE_CHANGED: data = SessionTitleChangedData.from_dict(data_obj)
-            case SessionEventType.SESSION_INFO: data = SessionInfoData.from_dict(data_obj)
-            case SessionEventType.SESSION_WARNING: data = SessionWarningData.from_dict(data_obj)
-            case SessionEventType.SESSION_MODEL_CHANGE: data = SessionModelChangeData.from_dict(data_obj)
-            case SessionEventType.SESSION_MODE_CHANGED: data = SessionModeChangedData.from_dict(data_obj)
-            case SessionEventType.SESSION_PLAN_CHANGED: data = SessionPlanChangedData.from_dict(data_obj)
-            case SessionEventType.SESSION_WORKSPACE_FILE_CHANGED: data = SessionWorkspaceFileChangedData.from_dict(data_obj)
-            case SessionEventType.SESSION_HANDOFF: data = SessionHandoffData.from_dict(data_obj)
-            case SessionEventType.SESSION_TRUNCATION: data = SessionTruncationData.from_dict(data_obj)
-            case SessionEventType.SESSION_SNAPSHOT_REWIND: data = SessionSnapshotRewindData.from_dict(data_obj)
-            case SessionEventType.SESSION_SHUTDOWN: data = SessionShutdownData.from_dict(data_obj)
-            case SessionEventType.SESSION_CONTEXT_CHANGED: data = SessionContextChangedData.from_dict(data_obj)
-            case SessionEventType.SESSION_USAGE_INFO: data = SessionUsageInfoData.from_dict(data_obj)
-            case SessionEventType.SESSION_COMPACTION_START: data = SessionCompactionStartData.from_dict(data_obj)
-            case SessionEventType.SESSION_COMPACTION_COMPLETE: data = SessionCompactionCompleteData.from_dict(data_obj)
-            case SessionEventType.SESSION_TASK_COMPLETE: data = SessionTaskCompleteData.from_dict(data_obj)
-            case SessionEventType.USER_MESSAGE: data = UserMessageData.from_dict(data_obj)
-            case SessionEventType.PENDING_MESSAGES_MODIFIED: data = PendingMessagesModifiedData.from_dict(data_obj)
-            case SessionEventType.ASSISTANT_TURN_START: data = AssistantTurnStartData.from_dict(data_obj)
-            case SessionEventType.ASSISTANT_INTENT: data = AssistantIntentData.from_dict(data_obj)
-            case SessionEventType.ASSISTANT_REASONING: data = AssistantReasoningData.from_dict(data_obj)
-            case SessionEventType.ASSISTANT_REASONING_DELTA: data = AssistantReasoningDeltaData.from_dict(data_obj)
-            case SessionEventType.ASSISTANT_STREAMING_DELTA: data = AssistantStreamingDeltaData.from_dict(data_obj)
-            case SessionEventType.ASSISTANT_MESSAGE: data = AssistantMessageData.from_dict(data_obj)
-            case SessionEventType.ASSISTANT_MESSAGE_DELTA: data = AssistantMessageDeltaData.from_dict(data_obj)
-            case SessionEventType.ASSISTANT_TURN_END: data = AssistantTurnEndData.from_dict(data_obj)
-            case SessionEventType.ASSISTANT_USAGE: data = AssistantUsageData.from_dict(data_obj)
-            case SessionEventType.MODEL_CALL_FAILURE: data = ModelCallFailureData.from_dict(data_obj)
-            case SessionEventType.ABORT: data = AbortData.from_dict(data_obj)
-            case SessionEventType.TOOL_USER_REQUESTED: data = ToolUserRequestedData.from_dict(data_obj)
-            case SessionEventType.TOOL_EXECUTION_START: data = ToolExecutionStartData.from_dict(data_obj)
-            case SessionEventType.TOOL_EXECUTION_PARTIAL_RESULT: data = ToolExecutionPartialResultData.from_dict(data_obj)
-            case SessionEventType.TOOL_EXECUTION_PROGRESS: data = ToolExecutionProgressData.from_dict(data_obj)
-            case SessionEventType.TOOL_EXECUTION_COMPLETE: data = ToolExecutionCompleteData.from_dict(data_obj)
-            case SessionEventType.SKILL_INVOKED: data = SkillInvokedData.from_dict(data_obj)
-            case SessionEventType.SUBAGENT_STARTED: data = SubagentStartedData.from_dict(data_obj)
-            case SessionEventType.SUBAGENT_COMPLETED: data = SubagentCompletedData.from_dict(data_obj)
-            case SessionEventType.SUBAGENT_FAILED: data = SubagentFailedData.from_dict(data_obj)
-            case SessionEventType.SUBAGENT_SELECTED: data = SubagentSelectedData.from_dict(data_obj)
-            case SessionEventType.SUBAGENT_DESELECTED: data = SubagentDeselectedData.from_dict(data_obj)
-            case SessionEventType.HOOK_START: data = HookStartData.from_dict(data_obj)
-            case SessionEventType.HOOK_END: data = HookEndData.from_dict(data_obj)
-            case SessionEventType.SYSTEM_MESSAGE: data = SystemMessageData.from_dict(data_obj)
-            case SessionEventType.SYSTEM_NOTIFICATION: data = SystemNotificationData.from_dict(data_obj)
-            case SessionEventType.PERMISSION_REQUESTED: data = PermissionRequestedData.from_dict(data_obj)
-            case SessionEventType.PERMISSION_COMPLETED: data = PermissionCompletedData.from_dict(data_obj)
-            case SessionEventType.USER_INPUT_REQUESTED: data = UserInputRequestedData.from_dict(data_obj)
-            case SessionEventType.USER_INPUT_COMPLETED: data = UserInputCompletedData.from_dict(data_obj)
-            case SessionEventType.ELICITATION_REQUESTED: data = ElicitationRequestedData.from_dict(data_obj)
-            case SessionEventType.ELICITATION_COMPLETED: data = ElicitationCompletedData.from_dict(data_obj)
-            case SessionEventType.SAMPLING_REQUESTED: data = SamplingRequestedData.from_dict(data_obj)
-            case SessionEventType.SAMPLING_COMPLETED: data = SamplingCompletedData.from_dict(data_obj)
-            case SessionEventType.MCP_OAUTH_REQUIRED: data = McpOauthRequiredData.from_dict(data_obj)
-            case SessionEventType.MCP_OAUTH_COMPLETED: data = McpOauthCompletedData.from_dict(data_obj)
-            case SessionEventType.EXTERNAL_TOOL_REQUESTED: data = ExternalToolRequestedData.from_dict(data_obj)
-            case SessionEventType.EXTERNAL_TOOL_COMPLETED: data = ExternalToolCompletedData.from_dict(data_obj)
-            case SessionEventType.COMMAND_QUEUED: data = CommandQueuedData.from_dict(data_obj)
-            case SessionEventType.COMMAND_EXECUTE: data = CommandExecuteData.from_dict(data_obj)
-            case SessionEventType.COMMAND_COMPLETED: data = CommandCompletedData.from_dict(data_obj)
-            case SessionEventType.AUTO_MODE_SWITCH_REQUESTED: data = AutoModeSwitchRequestedData.from_dict(data_obj)
-            case SessionEventType.AUTO_MODE_SWITCH_COMPLETED: data = AutoModeSwitchCompletedData.from_dict(data_obj)
-            case SessionEventType.COMMANDS_CHANGED: data = CommandsChangedData.from_dict(data_obj)
-            case SessionEventType.CAPABILITIES_CHANGED: data = CapabilitiesChangedData.from_dict(data_obj)
-            case SessionEventType.EXIT_PLAN_MODE_REQUESTED: data = ExitPlanModeRequestedData.from_dict(data_obj)
-            case SessionEventType.EXIT_PLAN_MODE_COMPLETED: data = ExitPlanModeCompletedData.from_dict(data_obj)
-            case SessionEventType.SESSION_TOOLS_UPDATED: data = SessionToolsUpdatedData.from_dict(data_obj)
-            case SessionEventType.SESSION_BACKGROUND_TASKS_CHANGED: data = SessionBackgroundTasksChangedData.from_dict(data_obj)
-            case SessionEventType.SESSION_SKILLS_LOADED: data = SessionSkillsLoadedData.from_dict(data_obj)
-            case SessionEventType.SESSION_CUSTOM_AGENTS_UPDATED: data = SessionCustomAgentsUpdatedData.from_dict(data_obj)
-            case SessionEventType.SESSION_MCP_SERVERS_LOADED: data = SessionMcpServersLoadedData.from_dict(data_obj)
-            case SessionEventType.SESSION_MCP_SERVER_STATUS_CHANGED: data = SessionMcpServerStatusChangedData.from_dict(data_obj)
-            case SessionEventType.SESSION_EXTENSIONS_LOADED: data = SessionExtensionsLoadedData.from_dict(data_obj)
-            case _: data = RawSessionEventData.from_dict(data_obj)
+        data = _SESSION_EVENT_DATA_PARSERS.get(event_type, RawSessionEventData.from_dict)(data_obj)
         return SessionEvent(
             data=data,
             id=event_id,
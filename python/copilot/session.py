@@ -11,10 +11,11 @@ from __future__ import annotations
 import asyncio
 import functools
 import inspect
+import logging
 import os
 import pathlib
 import threading
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Literal, NotRequired, Required, TypedDict, cast
@@ -62,6 +63,8 @@ if TYPE_CHECKING:
     from .client import ModelCapabilitiesOverride
     from .session_fs_provider import SessionFsProvider
 
+logger = logging.getLogger(__name__)
+
 # Re-export SessionEvent under an alias used internally
 SessionEventTypeAlias = SessionEvent
 
@@ -1176,20 +1179,21 @@ class CopilotSession:
             ...         case AssistantMessageData() as data:
             ...             print(data.content)
         """
-        idle_event = asyncio.Event()
-        error_event: Exception | None = None
+        # Resolved once, by the first session.idle or session.error event
+        outcome: asyncio.Future[SessionEvent | None] = asyncio.get_running_loop().create_future()
         last_assistant_message: SessionEvent | None = None
 
         def handler(event: SessionEventTypeAlias) -> None:
-            nonlocal last_assistant_message, error_event
+            nonlocal last_assistant_message
+            if outcome.done():
+                return
             match event.data:
                 case AssistantMessageData():
                     last_assistant_message = event
                 case SessionIdleData():
-                    idle_event.set()
+                    outcome.set_result(last_assistant_message)
                 case SessionErrorData() as data:
-                    error_event = Exception(f"Session error: {data.message or str(data)}")
-                    idle_event.set()
+                    outcome.set_exception(Exception(f"Session error: {data.message or str(data)}"))
 
         unsubscribe = self.on(handler)
         try:
@@ -1199,14 +1203,91 @@ class CopilotSession:
                 mode=mode,
                 request_headers=request_headers,
             )
-            await asyncio.wait_for(idle_event.wait(), timeout=timeout)
-            if error_event:
-                raise error_event
-            return last_assistant_message
+            return await asyncio.wait_for(outcome, timeout=timeout)
         except TimeoutError:
             raise TimeoutError(f"Timeout after {timeout}s waiting for session.idle")
         finally:
             unsubscribe()
+            if outcome.done() and not outcome.cancelled():
+                # Retrieve an error that was never awaited because send() itself failed
+                outcome.exception()
+            else:
+                outcome.cancel()
+
+    async def stream(
+        self,
+        prompt: str,
+        *,
+        attachments: list[Attachment] | None = None,
+        mode: Literal["enqueue", "immediate"] | None = None,
+        request_headers: dict[str, str] | None = None,
+        timeout: float = 60.0,
+    ) -> AsyncIterator[SessionEvent]:
+        """
+        Send a message to this session and iterate over the events it produces.
+
+        Events are yielded in arrival order, ending with the session.idle event.
+        Breaking out of the loop early stops the subscription once the iterator
+        is closed (use :func:`contextlib.aclosing` to close it deterministically).
+
+        Events are still delivered to handlers registered via :meth:`on` while
+        iterating.
+
+        Args:
+            prompt: The message text to send.
+            attachments: Optional file, directory, or selection attachments.
+            mode: Message delivery mode (``"enqueue"`` or ``"immediate"``).
+            request_headers: Optional per-turn HTTP headers for outbound model requests.
+            timeout: Timeout in seconds (default: 60) for the whole turn, measured
+                from the send. Only waiting for events that have not arrived yet
+                can time out; already-received events are always yielded. Does
+                not abort in-flight agent work.
+
+        Yields:
+            Each session event received until the session becomes idle.
+
+        Raises:
+            TimeoutError: If the timeout is reached before session becomes idle.
+            Exception: If a session.error event is received, the session has been
+                disconnected, or the connection fails.
+
+        Example:
+            >>> from copilot.generated.session_events import AssistantMessageData
+            >>> async for event in session.stream("What is 2+2?"):
+            ...     match event.data:
+            ...         case AssistantMessageData() as data:
+            ...             print(data.content)
+        """
+        events: asyncio.Queue[SessionEvent] = asyncio.Queue()
+        unsubscribe = self.on(events.put_nowait)
+        try:
+            await self.send(
+                prompt,
+                attachments=attachments,
+                mode=mode,
+                request_headers=request_headers,
+            )
+            deadline = asyncio.get_running_loop().time() + timeout
+            while True:
+                # Events that already arrived are yielded even past the deadline,
+                # so a slow consumer never times out with session.idle queued.
+                try:
+                    event = events.get_nowait()
+                except asyncio.QueueEmpty:
+                    try:
+                        async with asyncio.timeout_at(deadline):
+                            event = await events.get()
+                    except TimeoutError:
+                        raise TimeoutError(f"Timeout after {timeout}s waiting for session.idle")
+                match event.data:
+                    case SessionErrorData() as data:
+                        raise Exception(f"Session error: {data.message or str(data)}")
+                    case SessionIdleData():
+                        yield event
+                        return
+                yield event
+        finally:
+            unsubscribe()
 
     def on(self, handler: Callable[[SessionEvent], None]) -> Callable[[], None]:
         """
@@ -1267,8 +1348,8 @@ class CopilotSession:
         for handler in handlers:
             try:
                 handler(event)
-            except Exception as e:
-                print(f"Error in session event handler: {e}")
+            except Exception:
+                logger.exception("Error in session event handler")
 
     def _handle_broadcast_event(self, event: SessionEvent) -> None:
         """Handle broadcast request events by executing local handlers and responding via RPC.
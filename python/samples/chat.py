@@ -13,41 +13,43 @@ RESET = "\033[0m"
 
 
 async def main():
-    client = CopilotClient()
-    await client.start()
-    session = await client.create_session(on_permission_request=PermissionHandler.approve_all)
-
-    def on_event(event):
-        output = None
-        match event.data:
-            case AssistantReasoningData() as data:
-                output = f"[reasoning: {data.content}]"
-            case ToolExecutionStartData() as data:
-                output = f"[tool: {data.tool_name}]"
-        if output:
-            print(f"{BLUE}{output}{RESET}")
-
-    session.on(on_event)
-
-    print("Chat with Copilot (Ctrl+C to exit)\n")
-
-    while True:
-        user_input = input("You: ").strip()
-        if not user_input:
-            continue
-        print()
-
-        reply = await session.send_and_wait(user_input)
-        assistant_output = None
-        if reply:
-            match reply.data:
-                case AssistantMessageData() as data:
-                    assistant_output = data.content
-        print(f"\nAssistant: {assistant_output}\n")
+    # The client keeps one CLI process alive for the whole chat and stops it on
+    # exit; the session is disconnected before the client shuts down.
+    async with CopilotClient() as client:
+        async with await client.create_session(
+            on_permission_request=PermissionHandler.approve_all,
+        ) as session:
+            print("Chat with Copilot (Ctrl+C to exit)\n")
+
+            while True:
+                user_input = input("You: ").strip()
+                if not user_input:
+                    continue
+                print()
+
+                assistant_output = None
+                async for event in session.stream(user_input):
+                    match event.data:
+                        case AssistantReasoningData() as data:
+                            print(f"{BLUE}[reasoning: {data.content}]{RESET}")
+                        case ToolExecutionStartData() as data:
+                            print(f"{BLUE}[tool: {data.tool_name}]{RESET}")
+                        case AssistantMessageData() as data:
+                            assistant_output = data.content
+                print(f"\nAssistant: {assistant_output}\n")
 
 
 if __name__ == "__main__":
+    # Prefer uvloop's libuv-based event loop when it is installed (see the
+    # "samples" extra); fall back to the default asyncio loop otherwise.
     try:
-        asyncio.run(main())
+        import uvloop
+    except ImportError:
+        run = asyncio.run
+    else:
+        run = uvloop.run
+
+    try:
+        run(main())
     except KeyboardInterrupt:
         print("\nBye!")
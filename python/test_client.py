@@ -4,7 +4,10 @@ CopilotClient Unit Tests
 This file is for unit tests. Where relevant, prefer to add e2e tests in e2e/*.py instead.
 """
 
+import asyncio
+from datetime import datetime
 from unittest.mock import AsyncMock, patch
+from uuid import uuid4
 
 import pytest
 
@@ -17,6 +20,11 @@ from copilot.client import (
     ModelSupports,
     SubprocessConfig,
 )
+from copilot.generated.session_events import (
+    AssistantMessageData,
+    SessionIdleData,
+    session_event_from_dict,
+)
 from copilot.session import PermissionHandler, PermissionRequestResult
 from e2e.testharness import CLI_PATH
 
@@ -759,6 +767,158 @@ class TestCopilotClientContextManager:
             await client.__aexit__(None, None, None)
             mock_stop.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_aexit_force_stops_when_stop_exceeds_deadline(self):
+        client = CopilotClient(SubprocessConfig(cli_path=CLI_PATH))
+        with (
+            patch("copilot.client.CONTEXT_EXIT_STOP_TIMEOUT", 0.05),
+            patch.object(client, "stop", new=lambda: asyncio.sleep(10)),
+            patch.object(client, "force_stop", new_callable=AsyncMock) as mock_force_stop,
+        ):
+            await client.__aexit__(None, None, None)
+            mock_force_stop.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_aexit_force_stops_when_cancelled_during_stop(self):
+        client = CopilotClient(SubprocessConfig(cli_path=CLI_PATH))
+        stopping = asyncio.Event()
+
+        async def slow_stop() -> None:
+            stopping.set()
+            await asyncio.sleep(10)
+
+        with (
+            patch.object(client, "stop", new=slow_stop),
+            patch.object(client, "force_stop", new_callable=AsyncMock) as mock_force_stop,
+        ):
+            exit_task = asyncio.create_task(client.__aexit__(None, None, None))
+            await stopping.wait()
+            exit_task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await exit_task
+            mock_force_stop.assert_awaited_once()
+
+
+class TestStart:
+    @pytest.mark.asyncio
+    async def test_concurrent_start_spawns_one_server(self):
+        client = CopilotClient(SubprocessConfig(cli_path=CLI_PATH))
+        with (
+            patch.object(client, "_start_cli_server", new_callable=AsyncMock) as mock_spawn,
+            patch.object(client, "_connect_to_server", new_callable=AsyncMock) as mock_connect,
+            patch.object(client, "_verify_protocol_version", new_callable=AsyncMock),
+        ):
+            await asyncio.gather(client.start(), client.start(), client.start())
+
+        mock_spawn.assert_awaited_once()
+        mock_connect.assert_awaited_once()
+        assert client.get_state() == "connected"
+
+    @pytest.mark.asyncio
+    async def test_session_fs_provider_not_set_when_protocol_check_fails(self):
+        client = CopilotClient(
+            SubprocessConfig(
+                cli_path=CLI_PATH,
+                session_fs={
+                    "initial_cwd": "/",
+                    "session_state_path": "/session-state",
+                    "conventions": "posix",
+                },
+            )
+        )
+        with (
+            patch.object(client, "_start_cli_server", new_callable=AsyncMock),
+            patch.object(client, "_connect_to_server", new_callable=AsyncMock),
+            patch.object(
+                client,
+                "_verify_protocol_version",
+                new_callable=AsyncMock,
+                side_effect=RuntimeError("SDK protocol version mismatch"),
+            ),
+            patch.object(
+                client, "_set_session_fs_provider", new_callable=AsyncMock
+            ) as mock_set_provider,
+        ):
+            with pytest.raises(RuntimeError, match="protocol version mismatch"):
+                await client.start()
+
+        mock_set_provider.assert_not_awaited()
+        assert client.get_state() == "error"
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_in_progress_start(self):
+        client = CopilotClient(SubprocessConfig(cli_path=CLI_PATH))
+        connecting = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_connect() -> None:
+            connecting.set()
+            await release.wait()
+
+        with (
+            patch.object(client, "_start_cli_server", new_callable=AsyncMock),
+            patch.object(client, "_connect_to_server", new=slow_connect),
+            patch.object(client, "_verify_protocol_version", new_callable=AsyncMock),
+        ):
+            start_task = asyncio.create_task(client.start())
+            await connecting.wait()
+            stop_task = asyncio.create_task(client.stop())
+            await asyncio.sleep(0)
+            assert not stop_task.done()
+
+            release.set()
+            await start_task
+            await stop_task
+
+        assert client.get_state() == "disconnected"
+
+
+class TestStop:
+    @pytest.mark.asyncio
+    async def test_stop_disconnects_sessions_concurrently(self):
+        from copilot.session import CopilotSession
+
+        client = CopilotClient(SubprocessConfig(cli_path=CLI_PATH))
+        started: list[str] = []
+        all_started = asyncio.Event()
+
+        async def fake_disconnect(session_id: str) -> None:
+            started.append(session_id)
+            if len(started) == 3:
+                all_started.set()
+            # Only completes if every disconnect is in flight at the same time
+            await asyncio.wait_for(all_started.wait(), timeout=1.0)
+
+        for session_id in ("s1", "s2", "s3"):
+            session = CopilotSession(session_id, None)
+            session.disconnect = lambda sid=session_id: fake_disconnect(sid)  # type: ignore
+            client._sessions[session_id] = session
+
+        await client.stop()
+
+        assert sorted(started) == ["s1", "s2", "s3"]
+        assert client._sessions == {}
+
+    @pytest.mark.asyncio
+    async def test_stop_collects_disconnect_errors(self):
+        from copilot.client import StopError
+        from copilot.session import CopilotSession
+
+        client = CopilotClient(SubprocessConfig(cli_path=CLI_PATH))
+        ok = CopilotSession("ok", None)
+        ok.disconnect = AsyncMock()  # type: ignore
+        bad = CopilotSession("bad", None)
+        bad.disconnect = AsyncMock(side_effect=RuntimeError("boom"))  # type: ignore
+        client._sessions = {"ok": ok, "bad": bad}
+
+        with pytest.raises(ExceptionGroup) as exc_info:
+            await client.stop()
+
+        ok.disconnect.assert_awaited_once()
+        [error] = exc_info.value.exceptions
+        assert isinstance(error, StopError)
+        assert "bad" in error.message and "boom" in error.message
+
 
 class TestCopilotSessionContextManager:
     @pytest.mark.asyncio
@@ -777,3 +937,164 @@ class TestCopilotSessionContextManager:
         with patch.object(session, "disconnect", new_callable=AsyncMock) as mock_disconnect:
             await session.__aexit__(None, None, None)
             mock_disconnect.assert_awaited_once()
+
+
+def _session_event(event_type: str, data: dict):
+    return session_event_from_dict(
+        {
+            "id": str(uuid4()),
+            "timestamp": datetime.now().isoformat(),
+            "type": event_type,
+            "data": data,
+        }
+    )
+
+
+def _session_replying_with(*events):
+    """Create a session whose send() dispatches the given events on the next loop turns."""
+    from copilot.session import CopilotSession
+
+    session = CopilotSession("s1", None)
+
+    async def fake_send(prompt, **kwargs):
+        loop = asyncio.get_running_loop()
+        for event in events:
+            loop.call_soon(session._dispatch_event, event)
+        return "m1"
+
+    session.send = fake_send  # type: ignore
+    return session
+
+
+class TestCopilotSessionStream:
+    @pytest.mark.asyncio
+    async def test_stream_yields_events_until_idle(self):
+        session = _session_replying_with(
+            _session_event("assistant.message", {"content": "4", "messageId": "m1"}),
+            _session_event("session.idle", {}),
+            _session_event("assistant.message", {"content": "late", "messageId": "m2"}),
+        )
+
+        received = [event async for event in session.stream("What is 2+2?")]
+
+        assert [type(event.data) for event in received] == [AssistantMessageData, SessionIdleData]
+        assert received[0].data.content == "4"
+        assert not session._event_handlers
+
+    @pytest.mark.asyncio
+    async def test_stream_raises_on_session_error(self):
+        session = _session_replying_with(
+            _session_event("session.error", {"errorType": "model", "message": "boom"}),
+        )
+
+        with pytest.raises(Exception, match="Session error: boom"):
+            async for _ in session.stream("Hello"):
+                pass
+        assert not session._event_handlers
+
+    @pytest.mark.asyncio
+    async def test_stream_times_out_without_idle(self):
+        session = _session_replying_with()
+
+        with pytest.raises(TimeoutError, match="waiting for session.idle"):
+            async for _ in session.stream("Hello", timeout=0.05):
+                pass
+        assert not session._event_handlers
+
+    @pytest.mark.asyncio
+    async def test_stream_slow_consumer_still_reaches_queued_idle(self):
+        session = _session_replying_with(
+            _session_event("assistant.message", {"content": "4", "messageId": "m1"}),
+            _session_event("session.idle", {}),
+        )
+
+        received = []
+        async for event in session.stream("What is 2+2?", timeout=0.05):
+            received.append(event)
+            # Handling each event takes longer than the whole turn timeout
+            await asyncio.sleep(0.1)
+
+        assert [type(event.data) for event in received] == [AssistantMessageData, SessionIdleData]
+        assert not session._event_handlers
+
+
+class TestCopilotSessionSendAndWait:
+    @pytest.mark.asyncio
+    async def test_returns_last_assistant_message_at_idle(self):
+        session = _session_replying_with(
+            _session_event("assistant.message", {"content": "first", "messageId": "m1"}),
+            _session_event("assistant.message", {"content": "last", "messageId": "m2"}),
+            _session_event("session.idle", {}),
+            _session_event("session.error", {"errorType": "model", "message": "late"}),
+        )
+
+        reply = await session.send_and_wait("Hello")
+
+        assert reply is not None
+        assert isinstance(reply.data, AssistantMessageData)
+        assert reply.data.content == "last"
+        assert not session._event_handlers
+
+    @pytest.mark.asyncio
+    async def test_raises_first_session_error(self):
+        session = _session_replying_with(
+            _session_event("session.error", {"errorType": "model", "message": "boom"}),
+            _session_event("session.idle", {}),
+        )
+
+        with pytest.raises(Exception, match="Session error: boom"):
+            await session.send_and_wait("Hello")
+        assert not session._event_handlers
+
+    @pytest.mark.asyncio
+    async def test_times_out_without_idle(self):
+        session = _session_replying_with()
+
+        with pytest.raises(TimeoutError, match="waiting for session.idle"):
+            await session.send_and_wait("Hello", timeout=0.05)
+        assert not session._event_handlers
+
+
+class TestSessionEventDispatch:
+    def test_handler_error_is_logged_and_other_handlers_still_run(self, caplog):
+        from copilot.session import CopilotSession
+
+        session = CopilotSession("s1", None)
+        received = []
+
+        def failing_handler(event):
+            raise RuntimeError("boom")
+
+        session.on(failing_handler)
+        session.on(received.append)
+        event = _session_event("session.idle", {})
+
+        with caplog.at_level("ERROR", logger="copilot.session"):
+            session._dispatch_event(event)
+
+        assert received == [event]
+        [record] = caplog.records
+        assert record.getMessage() == "Error in session event handler"
+        assert record.exc_info is not None and "boom" in str(record.exc_info[1])
+
+
+class TestSessionMetadata:
+    def test_from_dict_builds_slotted_instances(self):
+        from copilot.client import SessionContext, SessionMetadata
+
+        payload = {
+            "sessionId": "s1",
+            "startTime": "2026-01-01T00:00:00Z",
+            "modifiedTime": "2026-01-02T00:00:00Z",
+            "isRemote": False,
+            "summary": "Refactor parser",
+            "context": {"cwd": "/repo", "repository": "owner/repo"},
+        }
+
+        metadata = SessionMetadata.from_dict(payload)
+
+        assert metadata.summary == "Refactor parser"
+        assert isinstance(metadata.context, SessionContext)
+        assert not hasattr(metadata, "__dict__")
+        assert not hasattr(metadata.context, "__dict__")
+        assert metadata.to_dict() == payload
@@ -13,12 +13,14 @@ from uuid import uuid4
 import pytest
 
 from copilot.generated.session_events import (
+    _SESSION_EVENT_DATA_PARSERS,
     Data,
     ElicitationCompletedAction,
     ElicitationRequestedMode,
     ElicitationRequestedSchema,
     PermissionRequest,
     PermissionRequestMemoryAction,
+    RawSessionEventData,
     SessionEventType,
     SessionTaskCompleteData,
     UserMessageAgentMode,
@@ -47,6 +49,26 @@ class TestEventForwardCompatibility:
         event = session_event_from_dict(unknown_event)
         assert event.type == SessionEventType.UNKNOWN, f"Expected UNKNOWN, got {event.type}"
 
+    def test_unknown_event_data_is_preserved_raw(self):
+        """Unknown event types should fall back to RawSessionEventData with the payload intact."""
+        unknown_event = {
+            "id": str(uuid4()),
+            "timestamp": datetime.now().isoformat(),
+            "parentId": None,
+            "type": "session.future_feature_from_server",
+            "data": {"someField": 1},
+        }
+
+        event = session_event_from_dict(unknown_event)
+        assert isinstance(event.data, RawSessionEventData)
+        assert event.data.raw == {"someField": 1}
+        assert event.to_dict()["type"] == "session.future_feature_from_server"
+
+    def test_every_known_event_type_has_a_data_parser(self):
+        """Each known event type should dispatch to its own data class, not the raw fallback."""
+        known_types = {t for t in SessionEventType if t is not SessionEventType.UNKNOWN}
+        assert set(_SESSION_EVENT_DATA_PARSERS) == known_types
+
     def test_malformed_uuid_raises_error(self):
         """Malformed UUIDs should raise ValueError for visibility, not be suppressed."""
         malformed_event = {
@@ -5,6 +5,7 @@ Tests for the JSON-RPC client implementation, focusing on proper handling
 of large payloads and short reads from pipes.
 """
 
+import asyncio
 import io
 import json
 import os
@@ -13,6 +14,7 @@ import time
 
 import pytest
 
+from copilot import _jsonrpc
 from copilot._jsonrpc import JsonRpcClient
 
 
@@ -285,8 +287,6 @@ class TestOnClose:
 
     def test_on_close_called_on_unexpected_exit(self):
         """on_close fires when the stream closes while client is still running."""
-        import asyncio
-
         process = MockProcess()
         process.stdout = ClosingStream()
 
@@ -304,8 +304,6 @@ class TestOnClose:
 
     def test_on_close_not_called_on_intentional_stop(self):
         """on_close should not fire when stop() is called intentionally."""
-        import asyncio
-
         r_fd, w_fd = os.pipe()
         process = MockProcess()
         process.stdout = os.fdopen(r_fd, "rb")
@@ -327,3 +325,64 @@ class TestOnClose:
             assert not called.is_set(), "on_close should not be called on intentional stop"
         finally:
             loop.close()
+
+
+class TestJsonCodec:
+    """Tests for the wire codec, which prefers orjson and falls back to stdlib json."""
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def codec(self, request, monkeypatch):
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(_jsonrpc, "orjson", None)
+        return _jsonrpc
+
+    def test_dumps_matches_compact_stdlib_output(self, codec):
+        message = {"jsonrpc": "2.0", "id": "1", "params": {"prompt": "héllo", "n": [1, 2.5, None]}}
+        assert json.loads(codec._dumps(message)) == message
+        assert b" " not in codec._dumps({"a": 1, "b": [1, 2]})
+
+    def test_dumps_accepts_non_string_keys(self, codec):
+        assert json.loads(codec._dumps({"result": {1: "one"}})) == {"result": {"1": "one"}}
+
+    def test_dumps_falls_back_for_values_orjson_rejects(self, codec):
+        message = {"value": 2**70}
+        assert json.loads(codec._dumps(message)) == message
+
+    def test_loads_round_trips_utf8(self, codec):
+        message = {"jsonrpc": "2.0", "method": "session.event", "params": {"text": "✓ done"}}
+        assert codec._loads(codec._dumps(message)) == message
+
+    def test_loads_accepts_lone_surrogate_escape(self, codec):
+        assert codec._loads(b'{"text":"cut \\ud800"}') == {"text": "cut \ud800"}
+
+    @pytest.mark.parametrize("value", [2**70, 2**64, -(2**63) - 1])
+    def test_loads_keeps_wide_integers_exact(self, codec, value):
+        decoded = codec._loads(f'{{"value":{value}}}'.encode())
+        assert decoded == {"value": value}
+        assert isinstance(decoded["value"], int)
+
+    def test_read_message_decodes_frame_orjson_rejects(self, codec):
+        process = MockProcess()
+        client = JsonRpcClient(process)
+        content = b'{"jsonrpc":"2.0","method":"session.event","params":{"text":"\\udc00"}}'
+        process.stdout = io.BytesIO(f"Content-Length: {len(content)}\r\n\r\n".encode() + content)
+
+        assert client._read_message() == {
+            "jsonrpc": "2.0",
+            "method": "session.event",
+            "params": {"text": "\udc00"},
+        }
+
+    def test_send_message_writes_header_and_body(self, codec):
+        process = MockProcess()
+        client = JsonRpcClient(process)
+        message = {"jsonrpc": "2.0", "method": "ping", "params": {}}
+
+        asyncio.run(client._send_message(message))
+
+        written = process.stdin.getvalue()
+        header, body = written.split(b"\r\n\r\n", 1)
+        assert header == f"Content-Length: {len(body)}".encode()
+        assert json.loads(body) == message
@@ -0,0 +1,65 @@
+"""
+Package import tests.
+
+Verifies that the top-level ``copilot`` package resolves its public names lazily,
+so importing lightweight submodules stays cheap.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import copilot
+
+
+def _loaded_modules_after(statement: str) -> set[str]:
+    """Run ``statement`` in a fresh interpreter and return the copilot modules it loaded."""
+    script = "\n".join(
+        [
+            "import sys",
+            statement,
+            "print('\\n'.join(m for m in sys.modules if m.startswith('copilot')))",
+        ]
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyExports:
+    def test_importing_tools_does_not_load_client(self):
+        modules = _loaded_modules_after("from copilot.tools import define_tool")
+        assert "copilot.tools" in modules
+        assert "copilot.client" not in modules
+        assert "copilot.generated.session_events" not in modules
+
+    def test_accessing_export_loads_its_module(self):
+        modules = _loaded_modules_after("from copilot import CopilotClient")
+        assert "copilot.client" in modules
+
+    @pytest.mark.parametrize("name", copilot.__all__)
+    def test_every_export_resolves(self, name):
+        value = getattr(copilot, name)
+        assert value is getattr(sys.modules[f"copilot{copilot._LAZY_EXPORTS[name]}"], name)
+
+    def test_all_matches_lazy_exports(self):
+        assert sorted(copilot.__all__) == sorted(copilot._LAZY_EXPORTS)
+
+    def test_submodules_stay_reachable_as_package_attributes(self):
+        script = "\n".join(
+            [
+                "import copilot",
+                "copilot.session.PermissionHandler",
+                "copilot.client.SessionMetadata",
+                "copilot.generated.session_events.SessionEvent",
+                "copilot.generated.rpc.ServerRpc",
+                "copilot._jsonrpc.JsonRpcClient",
+            ]
+        )
+        subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            copilot.missing  # noqa: B018
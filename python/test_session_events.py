@@ -0,0 +1,94 @@
+"""
+Generated session event model tests.
+
+Covers parsing of user message attachments and the memory layout of the
+generated dataclasses.
+"""
+
+from operator import attrgetter
+
+import pytest
+
+from copilot.generated.session_events import (
+    UserMessageAttachment,
+    UserMessageAttachmentSelectionDetails,
+    UserMessageAttachmentType,
+    from_none,
+    from_str,
+    from_union,
+)
+
+
+class TestAttachmentTypes:
+    @pytest.mark.parametrize(
+        ("payload", "expected"),
+        [
+            (
+                {"type": "file", "path": "/path/to/file.py", "displayName": "file.py"},
+                {
+                    "type": UserMessageAttachmentType.FILE,
+                    "path": "/path/to/file.py",
+                    "display_name": "file.py",
+                },
+            ),
+            (
+                {"type": "directory", "path": "/path/to/dir", "displayName": "dir"},
+                {
+                    "type": UserMessageAttachmentType.DIRECTORY,
+                    "path": "/path/to/dir",
+                    "display_name": "dir",
+                },
+            ),
+            (
+                {
+                    "type": "selection",
+                    "filePath": "/path/to/file.py",
+                    "displayName": "file.py",
+                    "text": "def foo(): pass",
+                    "selection": {
+                        "start": {"line": 1, "character": 0},
+                        "end": {"line": 1, "character": 15},
+                    },
+                },
+                {
+                    "type": UserMessageAttachmentType.SELECTION,
+                    "file_path": "/path/to/file.py",
+                    "text": "def foo(): pass",
+                    "selection.__class__": UserMessageAttachmentSelectionDetails,
+                    "selection.start.line": 1,
+                    "selection.end.character": 15,
+                },
+            ),
+            (
+                {"type": "selection"},
+                {
+                    "type": UserMessageAttachmentType.SELECTION,
+                    "selection": None,
+                    "text": None,
+                },
+            ),
+        ],
+        ids=["file", "directory", "selection", "selection-without-optional-fields"],
+    )
+    def test_attachment_from_dict(self, payload, expected):
+        """Each attachment kind should parse its fields; missing optional fields parse as None."""
+        attachment = UserMessageAttachment.from_dict(payload)
+        for path, value in expected.items():
+            assert attrgetter(path)(attachment) == value, path
+
+
+class TestGeneratedModelLayout:
+    def test_generated_dataclasses_use_slots(self):
+        """Generated classes should be slotted so parsed events carry no per-instance __dict__."""
+        attachment = UserMessageAttachment.from_dict({"type": "file", "path": "/a"})
+        assert not hasattr(attachment, "__dict__")
+        with pytest.raises(AttributeError):
+            attachment.unexpected = True  # type: ignore[attr-defined]
+
+    def test_from_union_optional_fast_path(self):
+        """from_union should treat from_none as a None check without changing results."""
+        assert from_union([from_none, from_str], None) is None
+        assert from_union([from_none, from_str], "value") == "value"
+        assert from_union([from_str, from_none], None) is None
+        with pytest.raises(AssertionError):
+            from_union([from_none, from_str], 42)
@@ -1052,7 +1052,7 @@ function emitPyClass(
     if (isSchemaDeprecated(schema)) {
         lines.push(`# Deprecated: this type is deprecated and will be removed in a future version.`);
     }
-    lines.push(`@dataclass`);
+    lines.push(`@dataclass(slots=True)`);
     lines.push(`class ${typeName}:`);
     if (description || schema.description) {
         lines.push(`    ${pyDocstringLiteral(description || schema.description || "")}`);
@@ -1205,7 +1205,7 @@ function emitPyFlatDiscriminatedUnion(
     });
 
     const lines: string[] = [];
-    lines.push(`@dataclass`);
+    lines.push(`@dataclass(slots=True)`);
     lines.push(`class ${typeName}:`);
     if (description) {
         lines.push(`    ${pyDocstringLiteral(description)}`);
@@ -1358,6 +1358,12 @@ export function generatePythonSessionEventsCode(schema: JSONSchema7): string {
     out.push(``);
     out.push(`def from_union(fs: list[Callable[[Any], T]], x: Any) -> T:`);
     out.push(`    for f in fs:`);
+    out.push(`        # Optional fields are the common case: test for None directly instead of`);
+    out.push(`        # raising and catching an AssertionError from from_none on every value.`);
+    out.push(`        if f is from_none:`);
+    out.push(`            if x is None:`);
+    out.push(`                return x`);
+    out.push(`            continue`);
     out.push(`        try:`);
     out.push(`            return f(x)`);
     out.push(`        except Exception:`);
@@ -1409,7 +1415,7 @@ export function generatePythonSessionEventsCode(schema: JSONSchema7): string {
     out.push(eventTypeLines.join("\n"));
     out.push(``);
     out.push(``);
-    out.push(`@dataclass`);
+    out.push(`@dataclass(slots=True)`);
     out.push(`class RawSessionEventData:`);
     out.push(`    raw: Any`);
     out.push(``);
@@ -1504,7 +1510,20 @@ export function generatePythonSessionEventsCode(schema: JSONSchema7): string {
     out.push(`SessionEventData = ${sessionEventDataTypes.join(" | ")}`);
     out.push(``);
     out.push(``);
-    out.push(`@dataclass`);
+    // Dispatch table keyed by event type: a single dict lookup per event instead of
+    // walking one match arm per variant.
+    out.push(
+        `_SESSION_EVENT_DATA_PARSERS: dict[SessionEventType, Callable[[Any], SessionEventData]] = {`
+    );
+    for (const variant of variants) {
+        out.push(
+            `    SessionEventType.${toEnumMemberName(variant.typeName)}: ${variant.dataClassName}.from_dict,`
+        );
+    }
+    out.push(`}`);
+    out.push(``);
+    out.push(``);
+    out.push(`@dataclass(slots=True)`);
     out.push(`class SessionEvent:`);
     out.push(`    data: SessionEventData`);
     out.push(`    id: UUID`);
@@ -1524,13 +1543,9 @@ export function generatePythonSessionEventsCode(schema: JSONSchema7): string {
     out.push(`        ephemeral = from_union([from_bool, from_none], obj.get("ephemeral"))`);
     out.push(`        parent_id = from_union([from_none, from_uuid], obj.get("parentId"))`);
     out.push(`        data_obj = obj.get("data")`);
-    out.push(`        match event_type:`);
-    for (const variant of variants) {
-        out.push(
-            `            case SessionEventType.${toEnumMemberName(variant.typeName)}: data = ${variant.dataClassName}.from_dict(data_obj)`
-        );
-    }
-    out.push(`            case _: data = RawSessionEventData.from_dict(data_obj)`);
+    out.push(
+        `        data = _SESSION_EVENT_DATA_PARSERS.get(event_type, RawSessionEventData.from_dict)(data_obj)`
+    );
     out.push(`        return SessionEvent(`);
     out.push(`            data=data,`);
     out.push(`            id=event_id,`);